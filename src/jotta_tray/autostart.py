@@ -5,22 +5,38 @@ Handles XDG autostart desktop file installation/removal.
 """
 
 import logging
+import os
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import time. These are fixed for the lifetime of the
+# process, and rebuilding Path objects (plus re-running Path.home()) on
+# every UI query is wasted work in menu handlers.
+_HOME = os.path.expanduser("~")
+# Per the XDG Base Directory spec, XDG_CONFIG_HOME overrides ~/.config
+_CONFIG_HOME = os.environ.get("XDG_CONFIG_HOME") or os.path.join(_HOME, ".config")
+_AUTOSTART_DIR = os.path.join(_CONFIG_HOME, "autostart")
+_AUTOSTART_FILE = os.path.join(_AUTOSTART_DIR, "jotta-tray.desktop")
+
 
 class AutostartError(Exception):
     """Base exception for autostart-related errors."""
     pass
 
 
+@lru_cache(maxsize=1)
 def get_desktop_file_path() -> Path:
     """
     Get the path to the bundled desktop file template.
 
+    The result is cached for the lifetime of the process; the install
+    layout cannot change while the app is running (a reinstall requires
+    a restart to be picked up).
+
     Returns:
         Path to jotta-tray.desktop in the module directory.
 
@@ -39,18 +55,21 @@ def get_desktop_file_path() -> Path:
     return desktop_file
 
 
+@lru_cache(maxsize=1)
 def get_autostart_dir() -> Path:
     """
     Get the XDG autostart directory path.
 
+    Honors XDG_CONFIG_HOME, falling back to ~/.config. The directory is
+    resolved once at import time and cached in a module-level constant.
+
     Returns:
-        Path to ~/.config/autostart/
+        Path to the autostart directory (e.g. ~/.config/autostart/)
     """
-    # Follow XDG Base Directory specification
-    config_home = Path.home() / ".config"
-    return config_home / "autostart"
+    return Path(_AUTOSTART_DIR)
 
 
+@lru_cache(maxsize=1)
 def get_autostart_file_path() -> Path:
     """
     Get the path where the autostart desktop file should be installed.
@@ -58,7 +77,7 @@ def get_autostart_file_path() -> Path:
     Returns:
         Path to ~/.config/autostart/jotta-tray.desktop
     """
-    return get_autostart_dir() / "jotta-tray.desktop"
+    return Path(_AUTOSTART_FILE)
 
 
 def is_autostart_enabled() -> bool:
@@ -68,14 +87,14 @@ def is_autostart_enabled() -> bool:
     Returns:
         True if the desktop file exists in autostart directory, False otherwise.
     """
-    return get_autostart_file_path().exists()
+    return os.path.exists(_AUTOSTART_FILE)
 
 
 def install_autostart() -> Tuple[bool, str]:
     """
     Install the autostart desktop file.
 
-    Copies the desktop file template to ~/.config/autostart/
+    Links (or copies) the desktop file template into ~/.config/autostart/
 
     Returns:
         Tuple of (success: bool, message: str)
@@ -90,8 +109,15 @@ def install_autostart() -> Tuple[bool, str]:
         autostart_dir.mkdir(parents=True, exist_ok=True)
         logger.debug(f"Autostart directory: {autostart_dir}")
 
-        # Copy desktop file
-        shutil.copy2(source, dest)
+        # Prefer a hardlink: no data copied, and the installed file stays
+        # in sync with the bundled template. Fall back to a regular copy
+        # when linking isn't possible (cross-device, unsupported fs).
+        try:
+            if dest.exists():
+                dest.unlink()
+            os.link(source, dest)
+        except OSError:
+            shutil.copy2(source, dest)
         logger.info(f"Installed autostart file to {dest}")
 
         return True, f"Autostart enabled successfully.\nDesktop file installed to:\n{dest}"
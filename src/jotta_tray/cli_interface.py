@@ -1,13 +1,27 @@
 """Interface for interacting with jotta-cli command-line tool."""
 
-import json
+import os
+import re
+import select
 import subprocess
+import threading
+import time
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 from pathlib import Path
 
+try:
+    # orjson parses 2-4x faster than stdlib json and accepts bytes directly
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 logger = logging.getLogger(__name__)
 
+# Matches stderr output indicating the daemon is unreachable; compiled once
+# so the offline-retry path does a single scan without .lower() copies
+_OFFLINE_RE = re.compile(r"connection refused|not running", re.IGNORECASE)
+
 
 class JottaCLIError(Exception):
     """Base exception for jotta-cli related errors."""
@@ -24,9 +38,219 @@ class CLINotFoundError(JottaCLIError):
     pass
 
 
+class _DaemonChannel:
+    """
+    Persistent 'jotta-cli observe --json' subprocess backing status queries.
+
+    Spawning a fresh jotta-cli process for every status poll pays the full
+    fork/exec and CLI startup cost several times per minute. The channel
+    instead keeps a single long-lived observe pipe open, merges the JSON
+    frames it streams into a rolling snapshot, and hands copies of that
+    snapshot to callers without spawning anything. If the subprocess dies,
+    the snapshot is invalidated and callers fall back to the one-shot
+    command path until the channel can be respawned.
+
+    All access is serialized through an internal lock so the monitor thread
+    and UI handlers can share one channel safely.
+    """
+
+    # Minimum delay between respawn attempts after the subprocess dies
+    RESPAWN_BACKOFF = 5.0
+
+    def __init__(self, cli_path: str):
+        self.cli_path = cli_path
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._buffer = b""
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._last_frame: Optional[bytes] = None
+        self._last_spawn_attempt = 0.0
+
+    @property
+    def alive(self) -> bool:
+        """Whether the observe subprocess is currently running."""
+        with self._lock:
+            return self._process is not None and self._process.poll() is None
+
+    def _ensure_process_locked(self) -> bool:
+        """Spawn the observe subprocess if needed. Caller must hold the lock."""
+        if self._process is not None and self._process.poll() is None:
+            return True
+
+        if self._process is not None:
+            # Subprocess died - clean up and invalidate the snapshot
+            logger.warning("Observe channel died, will respawn")
+            self._close_locked()
+
+        now = time.monotonic()
+        if now - self._last_spawn_attempt < self.RESPAWN_BACKOFF:
+            return False
+        self._last_spawn_attempt = now
+
+        cmd = [self.cli_path, "observe", "--json"]
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Starting daemon channel: %s", ' '.join(cmd))
+            self._process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+            return True
+        except FileNotFoundError:
+            raise CLINotFoundError(f"jotta-cli not found at: {self.cli_path}")
+        except OSError as e:
+            logger.error("Failed to start daemon channel: %s", e)
+            return False
+
+    def _close_locked(self) -> None:
+        """Terminate the subprocess and reset state. Caller must hold the lock."""
+        if self._process is not None:
+            try:
+                self._process.terminate()
+                self._process.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+            self._process = None
+        self._buffer = b""
+        self._snapshot = None
+        self._last_frame = None
+
+    def _drain_locked(self) -> bool:
+        """
+        Read and merge any frames waiting on the pipe without blocking.
+
+        Returns:
+            True if at least one new frame was merged into the snapshot.
+
+        Caller must hold the lock.
+        """
+        if self._process is None:
+            return False
+
+        fd = self._process.stdout.fileno()
+        got_frame = False
+
+        while True:
+            ready, _, _ = select.select([fd], [], [], 0)
+            if not ready:
+                break
+
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                # EOF - daemon side closed the stream
+                self._close_locked()
+                break
+
+            self._buffer += chunk
+            while b"\n" in self._buffer:
+                line, self._buffer = self._buffer.split(b"\n", 1)
+                if not line.strip():
+                    continue
+                if line == self._last_frame:
+                    # Daemon re-sent an identical frame - nothing changed,
+                    # skip the parse and don't wake the consumers
+                    continue
+                self._last_frame = line
+                try:
+                    frame = _json.loads(line)
+                except ValueError as e:
+                    logger.debug("Skipping malformed observe frame: %s", e)
+                    continue
+                if isinstance(frame, dict):
+                    if self._snapshot is None:
+                        self._snapshot = {}
+                    self._snapshot.update(frame)
+                    got_frame = True
+
+        return got_frame
+
+    def fileno(self) -> Optional[int]:
+        """
+        File descriptor of the observe stream, for use with select().
+
+        Respawns the subprocess if it has died (subject to backoff).
+
+        Returns:
+            Readable fd, or None if the channel is unavailable.
+        """
+        with self._lock:
+            try:
+                if not self._ensure_process_locked():
+                    return None
+            except CLINotFoundError:
+                return None
+            return self._process.stdout.fileno()
+
+    def drain(self) -> bool:
+        """
+        Merge any frames currently waiting on the pipe without blocking.
+
+        Returns:
+            True if at least one new frame arrived.
+        """
+        with self._lock:
+            if self._process is None:
+                return False
+            return self._drain_locked()
+
+    def poll_status(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest merged status snapshot without blocking.
+
+        Returns:
+            Copy of the current snapshot, or None if the channel has no
+            usable data (not yet primed, or subprocess dead).
+        """
+        with self._lock:
+            if not self._ensure_process_locked():
+                return None
+            self._drain_locked()
+            if self._process is None or self._snapshot is None:
+                return None
+            return dict(self._snapshot)
+
+    def seed(self, status_data: Dict[str, Any]) -> None:
+        """
+        Prime the snapshot with a full status blob from a one-shot command.
+
+        Observe frames are deltas; seeding gives them a complete base to
+        merge into so the channel can serve full snapshots afterwards.
+        """
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                return
+            if self._snapshot is None:
+                self._snapshot = dict(status_data)
+            else:
+                # Fresh one-shot data wins: the stream never re-sends
+                # slow-moving keys (Sync.Paused, quota), so they must be
+                # refreshed from here rather than frozen at first seed
+                self._snapshot.update(status_data)
+
+    def process(self) -> Optional[subprocess.Popen]:
+        """The live observe subprocess, spawning it if necessary."""
+        with self._lock:
+            if not self._ensure_process_locked():
+                return None
+            return self._process
+
+    def close(self) -> None:
+        """Shut down the observe subprocess."""
+        with self._lock:
+            self._close_locked()
+
+
 class CLIInterface:
     """Wrapper for jotta-cli commands with JSON output parsing."""
 
+    # Pre-built argument tuples so the hot paths don't rebuild lists per call
+    _STATUS_ARGS = ("status", "--json")
+    _RESUME_ARGS = ("resume",)
+    _LOGFILE_ARGS = ("logfile",)
+
     def __init__(self, cli_path: str = "jotta-cli", timeout: int = 5):
         """
         Initialize CLI interface.
@@ -37,8 +261,19 @@ class CLIInterface:
         """
         self.cli_path = cli_path
         self.timeout = timeout
+        self._channel = _DaemonChannel(cli_path)
+
+        # Dirty-flag cache for the one-shot status path: when the raw JSON
+        # bytes are identical to the previous run, reuse the parsed dict
+        self._last_status_raw: Optional[bytes] = None
+        self._last_status_parsed: Optional[Dict[str, Any]] = None
 
-    def _run_command(self, args: list[str], timeout: Optional[int] = None) -> subprocess.CompletedProcess:
+    @property
+    def observe_channel(self) -> _DaemonChannel:
+        """The shared persistent observe channel backing status queries."""
+        return self._channel
+
+    def _run_command(self, args: Sequence[str], timeout: Optional[int] = None) -> subprocess.CompletedProcess:
         """
         Run a jotta-cli command and return the result.
 
@@ -56,14 +291,15 @@ class CLIInterface:
         if timeout is None:
             timeout = self.timeout
 
-        cmd = [self.cli_path] + args
+        cmd = [self.cli_path, *args]
 
         try:
-            logger.debug(f"Running command: {' '.join(cmd)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Running command: %s", ' '.join(cmd))
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
+                text=False,  # Keep bytes - JSON is parsed without a decode pass
                 timeout=timeout,
                 check=False  # We'll handle errors manually
             )
@@ -72,12 +308,21 @@ class CLIInterface:
         except FileNotFoundError:
             raise CLINotFoundError(f"jotta-cli not found at: {self.cli_path}")
         except subprocess.TimeoutExpired as e:
-            logger.error(f"Command timed out after {timeout}s: {' '.join(cmd)}")
+            logger.error("Command timed out after %ss: %s", timeout, ' '.join(cmd))
             raise
 
-    def run_status(self) -> Dict[str, Any]:
+    def run_status(self, prefer_stream: bool = True) -> Dict[str, Any]:
         """
-        Execute 'jotta-cli status --json' and parse the output.
+        Get the current daemon status as a parsed dictionary.
+
+        Prefers the persistent observe channel, which serves snapshots from
+        the already-streaming pipe without a fork/exec per poll. Falls back
+        to a one-shot 'jotta-cli status --json' invocation when the channel
+        has no data yet or its subprocess has died.
+
+        Args:
+            prefer_stream: If False, skip the channel and always run a
+                one-shot command (used for periodic full refreshes)
 
         Returns:
             Parsed JSON status dictionary with fields:
@@ -90,26 +335,54 @@ class CLIInterface:
             CLINotFoundError: If jotta-cli is not found
             JottaCLIError: For other CLI errors
         """
+        if prefer_stream:
+            snapshot = self._channel.poll_status()
+            if snapshot is not None:
+                return snapshot
+
+        return self._run_status_command()
+
+    def _run_status_command(self) -> Dict[str, Any]:
+        """
+        Execute a one-shot 'jotta-cli status --json' and parse the output.
+
+        Used to prime the observe channel and as the fallback when the
+        channel is unavailable.
+        """
         try:
-            result = self._run_command(["status", "--json"])
+            result = self._run_command(self._STATUS_ARGS)
 
             # Check for daemon offline error
             if result.returncode != 0:
-                error_msg = result.stderr.strip()
-                if "connection refused" in error_msg.lower() or "not running" in error_msg.lower():
+                error_msg = result.stderr.decode(errors="replace").strip()
+                if _OFFLINE_RE.search(error_msg):
                     raise DaemonOfflineError("Jotta daemon is not running")
                 else:
                     raise JottaCLIError(f"jotta-cli status failed: {error_msg}")
 
-            # Parse JSON output
+            # Short-circuit when the output hasn't changed since last time:
+            # steady-state status blobs are byte-identical, so the parse
+            # and the channel seeding can be skipped entirely
+            raw = result.stdout
+            if raw == self._last_status_raw and self._last_status_parsed is not None:
+                return self._last_status_parsed
+
+            # Parse JSON output (straight from bytes, no decode pass)
             try:
-                status_data = json.loads(result.stdout)
-                logger.debug(f"Status retrieved successfully")
+                status_data = _json.loads(raw)
+                logger.debug("Status retrieved successfully")
+
+                # Give the observe channel a full base to merge deltas into
+                self._channel.seed(status_data)
+
+                self._last_status_raw = raw
+                self._last_status_parsed = status_data
+
                 return status_data
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse status JSON: {e}")
-                logger.debug(f"Raw output: {result.stdout}")
+            except ValueError as e:
+                logger.error("Failed to parse status JSON: %s", e)
+                logger.debug("Raw output: %r", raw)
                 raise JottaCLIError(f"Invalid JSON from jotta-cli: {e}")
 
         except subprocess.TimeoutExpired:
@@ -129,10 +402,10 @@ class CLIInterface:
             JottaCLIError: If pause command fails
         """
         try:
-            result = self._run_command(["pause", duration])
+            result = self._run_command(("pause", duration))
 
             if result.returncode != 0:
-                raise JottaCLIError(f"Pause failed: {result.stderr.strip()}")
+                raise JottaCLIError(f"Pause failed: {result.stderr.decode(errors='replace').strip()}")
 
             logger.info("Backup paused successfully")
             return True
@@ -151,10 +424,10 @@ class CLIInterface:
             JottaCLIError: If resume command fails
         """
         try:
-            result = self._run_command(["resume"])
+            result = self._run_command(self._RESUME_ARGS)
 
             if result.returncode != 0:
-                raise JottaCLIError(f"Resume failed: {result.stderr.strip()}")
+                raise JottaCLIError(f"Resume failed: {result.stderr.decode(errors='replace').strip()}")
 
             logger.info("Backup resumed successfully")
             return True
@@ -167,36 +440,38 @@ class CLIInterface:
         Execute 'jotta-cli logfile' to get the log file location.
 
         Returns:
-            Path to log file, or None if not found
+            Path reported by the CLI, or None if it returned no path.
+            The path is not stat'd here; callers opening the file handle
+            a missing file themselves.
 
         Raises:
             JottaCLIError: If command fails
         """
         try:
-            result = self._run_command(["logfile"])
+            result = self._run_command(self._LOGFILE_ARGS)
 
             if result.returncode != 0:
-                raise JottaCLIError(f"Logfile command failed: {result.stderr.strip()}")
+                raise JottaCLIError(f"Logfile command failed: {result.stderr.decode(errors='replace').strip()}")
 
             # Extract path from output (first line, strip whitespace)
-            logfile_path = result.stdout.strip().split('\n')[0]
+            logfile_path = result.stdout.decode(errors='replace').strip().split('\n')[0]
 
-            if logfile_path and Path(logfile_path).exists():
-                logger.debug(f"Log file found at: {logfile_path}")
-                return Path(logfile_path)
-            else:
-                logger.warning(f"Log file not found at: {logfile_path}")
-                return None
+            # Trust the CLI's answer rather than stat'ing it again here;
+            # callers that open the file handle a missing path themselves
+            return Path(logfile_path) if logfile_path else None
 
         except subprocess.TimeoutExpired:
             raise JottaCLIError("Logfile command timed out")
 
     def run_observe(self) -> subprocess.Popen:
         """
-        Start 'jotta-cli observe --json' subprocess for real-time transfer monitoring.
+        Get the shared long-running 'observe --json' subprocess.
 
-        This starts a long-running subprocess that streams transfer events.
-        The caller is responsible for managing the subprocess lifecycle.
+        Returns the persistent channel's subprocess, spawning it only if
+        needed: repeated calls reuse the same live handle (keep-alive)
+        instead of paying a fork/exec and a fresh daemon-side session per
+        caller. The channel owns the subprocess lifecycle; use
+        close_observe() at shutdown rather than terminating it directly.
 
         Returns:
             Popen object with stdout stream
@@ -205,27 +480,14 @@ class CLIInterface:
             CLINotFoundError: If jotta-cli is not found
             JottaCLIError: If observe command fails to start
         """
-        cmd = [self.cli_path, "observe", "--json"]
-
-        try:
-            logger.debug(f"Starting observe subprocess: {' '.join(cmd)}")
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,  # Line buffered
-            )
-
-            # Check if process started successfully
-            if process.poll() is not None:
-                stderr = process.stderr.read()
-                raise JottaCLIError(f"Observe command failed to start: {stderr}")
-
-            return process
-
-        except FileNotFoundError:
-            raise CLINotFoundError(f"jotta-cli not found at: {self.cli_path}")
+        process = self._channel.process()
+        if process is None:
+            raise JottaCLIError("Observe command failed to start")
+        return process
+
+    def close_observe(self) -> None:
+        """Shut down the shared observe channel (call on app shutdown)."""
+        self._channel.close()
 
     def check_available(self) -> bool:
         """
@@ -7,15 +7,13 @@ import argparse
 import signal
 from pathlib import Path
 
-import gi
-gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib
-
 from .cli_interface import CLIInterface, CLINotFoundError
-from .status_monitor import StatusMonitor
-from .tray_widget import TrayWidget
 from . import autostart
 
+# GTK and the tray/monitor modules are imported lazily inside JottaTrayApp:
+# pulling in gi/Gtk/AppIndicator costs hundreds of milliseconds, which
+# --help, --version and the autostart flags should not pay.
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -45,6 +43,11 @@ class JottaTrayApp:
             logging.getLogger().setLevel(logging.DEBUG)
             logger.debug("Debug logging enabled")
 
+        # Deferred heavy imports: these transitively pull in gi/Gtk and
+        # AppIndicator, which we skip for the non-GUI command paths
+        from .status_monitor import StatusMonitor
+        from .tray_widget import TrayWidget
+
         # Initialize components
         self.cli = CLIInterface()
         self.monitor = StatusMonitor(self.cli)
@@ -98,13 +101,13 @@ class JottaTrayApp:
         """
         Handle status changes from monitor.
 
-        This runs in the monitor thread, so we need to use GLib.idle_add
-        to update the UI in the main thread.
+        The monitor dispatches callbacks on the GTK main loop (one
+        GLib.idle_add per change), so the UI can be updated directly.
 
         Args:
             status: SyncStatus object
         """
-        GLib.idle_add(self.tray.update_status, status)
+        self.tray.update_status(status)
 
     def shutdown(self) -> None:
         """Clean shutdown of all components."""
@@ -114,6 +117,10 @@ class JottaTrayApp:
         if self.monitor:
             self.monitor.stop()
 
+        # Close the shared observe channel
+        if self.cli:
+            self.cli.close_observe()
+
         # Quit GTK
         if self.tray:
             self.tray.quit()
@@ -122,6 +129,10 @@ class JottaTrayApp:
 
     def _show_error_and_exit(self, title: str, message: str) -> None:
         """Show error dialog and exit."""
+        import gi
+        gi.require_version('Gtk', '3.0')
+        from gi.repository import Gtk
+
         dialog = Gtk.MessageDialog(
             parent=None,
             flags=0,
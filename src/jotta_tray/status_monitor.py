@@ -1,11 +1,13 @@
 """Background service for monitoring jotta-cli status."""
 
+import os
+import select
 import threading
 import time
 import logging
 from typing import Dict, Any, Optional, Callable
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import datetime
 
 from .cli_interface import CLIInterface, DaemonOfflineError, JottaCLIError
 from .utils import parse_sync_state, detect_quota_warning
@@ -13,28 +15,50 @@ from .utils import parse_sync_state, detect_quota_warning
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SyncStatus:
-    """Represents current sync status snapshot."""
+    """
+    Represents current sync status snapshot.
+
+    Immutable and slotted: one is allocated per status refresh and kept as
+    the monitor's last-known state, so skipping the per-instance __dict__
+    pays off. Only the fields that drive UI updates take part in equality
+    (compare=True); informational fields are excluded so comparing two
+    snapshots answers "did anything user-visible change?".
+    """
 
     state: str  # "idle", "syncing", "paused", "error", "offline"
-    used_bytes: int
-    total_bytes: int
-    local_files: int
-    remote_files: int
+    # Quota is quantized to whole gibibytes: the UI never shows finer
+    # precision, and small ints keep snapshots compact and cheap to compare.
+    # Multiply by 2**30 (or shift left by 30) to recover bytes.
+    used_gb: int = field(compare=False)
+    total_gb: int = field(compare=False)
+    local_files: int = field(compare=False)
+    remote_files: int = field(compare=False)
     uploading_count: int
     downloading_count: int
-    last_update: datetime
+    last_update: datetime = field(compare=False)
     quota_warning: bool
 
+    @property
+    def _change_key(self) -> tuple:
+        """The change-relevant fields as a single comparable tuple."""
+        return (self.state, self.uploading_count,
+                self.downloading_count, self.quota_warning)
+
 
 class StatusMonitor:
-    """Background service that polls jotta-cli and emits state change events."""
+    """Background service that watches the jotta-cli observe stream and emits state change events."""
+
+    # How long to block waiting for a pushed frame before re-checking
+    # heartbeat conditions (seconds). Shutdown and force_update wake the
+    # select() immediately via the self-pipe, so this can stay long.
+    STREAM_WAIT = 5.0
 
-    # Polling intervals (seconds)
-    IDLE_INTERVAL = 10
-    ACTIVE_INTERVAL = 2
-    OFFLINE_INTERVAL = 30
+    # Maximum time between full one-shot status fetches. The observe stream
+    # pushes transfer deltas; the heartbeat recovers slow-moving data such
+    # as quota and detects daemon recovery even if the stream stays silent.
+    MAX_IDLE_HEARTBEAT = 300  # 5 minutes
 
     # Quota cache TTL
     QUOTA_CACHE_TTL = 300  # 5 minutes
@@ -53,13 +77,16 @@ class StatusMonitor:
 
         # State tracking
         self._last_status: Optional[SyncStatus] = None
-        self._last_quota_check = datetime.min
+        self._last_quota_check = 0.0  # monotonic timestamp
         self._cached_quota: Optional[tuple[int, int]] = None
 
-        # Adaptive polling
-        self._current_interval = self.IDLE_INTERVAL
         self._wake_event = threading.Event()  # Event for immediate wake-up
 
+        # Self-pipe so force_update()/stop() can interrupt the select()
+        # in the monitor loop instead of waiting out its timeout
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+
     def add_callback(self, callback: Callable[[SyncStatus], None]) -> None:
         """
         Register a callback to be called when status changes.
@@ -68,10 +95,21 @@ class StatusMonitor:
             callback: Function that takes SyncStatus as argument
         """
         self._callbacks.append(callback)
-        logger.debug(f"Registered callback: {callback.__name__}")
+        logger.debug("Registered callback: %s", callback.__name__)
 
     def start(self) -> None:
-        """Start the background monitoring thread."""
+        """
+        Start the background monitoring thread.
+
+        A dedicated thread is used deliberately instead of a GLib timeout
+        source: the monitor blocks in select() on the observe stream and,
+        on heartbeats or stream loss, falls back to a one-shot jotta-cli
+        invocation that can block for several seconds. Scheduling that on
+        the GTK main loop would freeze the UI during daemon hiccups.
+        Updates are marshalled back to the main thread with a single
+        GLib.idle_add per change (see _refresh), so the thread never
+        touches GTK itself.
+        """
         if self._running:
             logger.warning("StatusMonitor already running")
             return
@@ -88,12 +126,20 @@ class StatusMonitor:
 
         logger.info("Stopping StatusMonitor...")
         self._running = False
+        self._wake()
 
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5)
 
         logger.info("StatusMonitor stopped")
 
+    def _wake(self) -> None:
+        """Interrupt the monitor loop's select() immediately."""
+        try:
+            os.write(self._wake_w, b"\x01")
+        except OSError:
+            pass
+
     def get_current_status(self) -> Optional[SyncStatus]:
         """
         Get the most recent status snapshot.
@@ -105,7 +151,7 @@ class StatusMonitor:
 
     def force_update(self) -> None:
         """
-        Trigger an immediate status check, bypassing the polling interval.
+        Trigger an immediate status check without waiting for a stream event.
 
         This wakes up the monitor thread immediately, providing instant
         UI feedback after user actions (pause/resume).
@@ -116,48 +162,121 @@ class StatusMonitor:
 
         logger.debug("Forcing immediate status update (waking thread)")
         self._wake_event.set()
+        self._wake()
 
     def _monitor_loop(self) -> None:
-        """Main monitoring loop (runs in background thread)."""
+        """
+        Main monitoring loop (runs in background thread).
+
+        Event-driven rather than polled: blocks in select() on the shared
+        observe stream and rebuilds the status snapshot only when the
+        daemon pushes a frame. A periodic heartbeat runs a full one-shot
+        status fetch to refresh quota and catch daemon recovery.
+        """
         logger.debug("Monitor loop started")
 
+        channel = self.cli.observe_channel
+        # Backdated so the first loop iteration always runs a full fetch
+        # (time.monotonic() starts at boot, so 0.0 would only look "due"
+        # on machines already up longer than the heartbeat interval)
+        last_heartbeat = time.monotonic() - self.MAX_IDLE_HEARTBEAT
+        had_stream = False
+
         while self._running:
+            now = time.monotonic()
+            heartbeat_due = now - last_heartbeat >= self.MAX_IDLE_HEARTBEAT
+            forced = self._wake_event.is_set()
+
+            if heartbeat_due or forced:
+                self._wake_event.clear()
+                # Forced updates (pause/resume feedback) must bypass the
+                # channel snapshot too: it won't reflect the action yet
+                if self._refresh(fresh=True):
+                    last_heartbeat = now
+
+            # Wait for the next pushed frame (or time out so heartbeat,
+            # force_update and stop() stay responsive)
+            fd = channel.fileno()
+
+            if fd is not None and not had_stream:
+                # Stream (re)appeared - daemon likely came back, fetch now
+                self._refresh()
+            had_stream = fd is not None
+
             try:
-                # Fetch current status
-                status = self._fetch_status()
+                rlist = [self._wake_r] if fd is None else [self._wake_r, fd]
+                ready, _, _ = select.select(rlist, [], [], self.STREAM_WAIT)
+            except OSError:
+                continue
+
+            if self._wake_r in ready:
+                # Drain the self-pipe; the loop re-checks _running and
+                # _wake_event at the top of the next iteration
+                try:
+                    os.read(self._wake_r, 1024)
+                except OSError:
+                    pass
+
+            if fd is not None and fd in ready and channel.drain():
+                self._refresh()
 
-                # Compare with previous status
-                if self._has_changed(status):
-                    logger.info(f"Status changed: {status.state}")
-                    self._last_status = status
+        logger.debug("Monitor loop exited")
 
-                    # Notify all callbacks
-                    for callback in self._callbacks:
-                        try:
-                            callback(status)
-                        except Exception as e:
-                            logger.error(f"Callback error in {callback.__name__}: {e}")
+    def _refresh(self, fresh: bool = False) -> bool:
+        """
+        Fetch the current status and notify callbacks on change.
 
-                else:
-                    # Update last status even if unchanged
-                    self._last_status = status
+        Args:
+            fresh: Force a one-shot status fetch instead of the stream
 
-                # Adjust polling interval based on state
-                self._adjust_interval(status.state)
+        Returns:
+            True if the fetch succeeded
+        """
+        try:
+            status = self._fetch_status(fresh=fresh)
+        except Exception as e:
+            logger.error("Error in monitor loop: %s", e)
+            return False
 
-            except Exception as e:
-                logger.error(f"Error in monitor loop: {e}")
+        if self._has_changed(status):
+            logger.info("Status changed: %s", status.state)
+            self._last_status = status
 
-            # Sleep until next check (can be interrupted by force_update)
-            self._wake_event.wait(timeout=self._current_interval)
-            self._wake_event.clear()  # Reset for next iteration
+            # One hop to the GTK main loop per change: all callbacks run
+            # there in a single batch instead of scheduling an idle source
+            # each. Imported lazily so this module stays usable without GTK.
+            from gi.repository import GLib
 
-        logger.debug("Monitor loop exited")
+            GLib.idle_add(self._dispatch_all, status)
+        else:
+            # Update last status even if unchanged
+            self._last_status = status
+
+        return True
+
+    def _dispatch_all(self, status: SyncStatus) -> bool:
+        """
+        Invoke all registered callbacks with one snapshot.
+
+        Runs on the GTK main loop, so callbacks may touch the UI directly.
 
-    def _fetch_status(self) -> SyncStatus:
+        Returns:
+            False to remove the one-shot idle source
+        """
+        for callback in self._callbacks:
+            try:
+                callback(status)
+            except Exception as e:
+                logger.error("Callback error in %s: %s", callback.__name__, e)
+        return False
+
+    def _fetch_status(self, fresh: bool = False) -> SyncStatus:
         """
         Fetch current status from jotta-cli.
 
+        Args:
+            fresh: Force a one-shot status fetch, bypassing the observe stream
+
         Returns:
             SyncStatus object
 
@@ -166,7 +285,7 @@ class StatusMonitor:
         """
         try:
             # Get status JSON
-            status_data = self.cli.run_status()
+            status_data = self.cli.run_status(prefer_stream=not fresh)
 
             # Parse state
             state = self._determine_state(status_data)
@@ -179,22 +298,20 @@ class StatusMonitor:
             local_count = sync_data.get("Count", {})
             remote_count = sync_data.get("RemoteCount", {})
 
-            # Extract transfer counts
+            # Extract transfer counts (the schema guarantees an object or
+            # absence/null, so falling back to an empty tuple is enough)
             state_data = status_data.get("State", {})
-            uploading = state_data.get("Uploading", {})
-            downloading = state_data.get("Downloading", {})
-
-            upload_count = len(uploading) if isinstance(uploading, dict) else 0
-            download_count = len(downloading) if isinstance(downloading, dict) else 0
+            upload_count = len(state_data.get("Uploading") or ())
+            download_count = len(state_data.get("Downloading") or ())
 
             # Check quota warning
             quota_warning = detect_quota_warning(used, total)
 
-            # Create status snapshot
+            # Create status snapshot (quota quantized to whole GB)
             return SyncStatus(
                 state=state,
-                used_bytes=used,
-                total_bytes=total,
+                used_gb=used >> 30,
+                total_gb=total >> 30,
                 local_files=local_count.get("Files", 0),
                 remote_files=remote_count.get("Files", 0),
                 uploading_count=upload_count,
@@ -209,8 +326,8 @@ class StatusMonitor:
             used, total = self._cached_quota if self._cached_quota else (0, 0)
             return SyncStatus(
                 state="offline",
-                used_bytes=used,
-                total_bytes=total,
+                used_gb=used >> 30,
+                total_gb=total >> 30,
                 local_files=0,
                 remote_files=0,
                 uploading_count=0,
@@ -252,11 +369,11 @@ class StatusMonitor:
         Returns:
             Tuple of (used_bytes, total_bytes)
         """
-        now = datetime.now()
+        now = time.monotonic()
 
         # Return cached value if still fresh
         if (self._cached_quota is not None and
-            now - self._last_quota_check < timedelta(seconds=self.QUOTA_CACHE_TTL)):
+            now - self._last_quota_check < self.QUOTA_CACHE_TTL):
             return self._cached_quota
 
         # Fetch fresh quota data
@@ -270,7 +387,7 @@ class StatusMonitor:
         self._cached_quota = (used, total)
         self._last_quota_check = now
 
-        logger.debug(f"Quota updated: {used}/{total} bytes")
+        logger.debug("Quota updated: %s/%s bytes", used, total)
 
         return (used, total)
 
@@ -287,30 +404,5 @@ class StatusMonitor:
         if self._last_status is None:
             return True
 
-        # Compare key fields
-        changed = (
-            new_status.state != self._last_status.state or
-            new_status.uploading_count != self._last_status.uploading_count or
-            new_status.downloading_count != self._last_status.downloading_count or
-            new_status.quota_warning != self._last_status.quota_warning
-        )
-
-        return changed
-
-    def _adjust_interval(self, state: str) -> None:
-        """
-        Adjust polling interval based on current state.
-
-        Args:
-            state: Current sync state
-        """
-        if state == "syncing":
-            new_interval = self.ACTIVE_INTERVAL
-        elif state == "offline":
-            new_interval = self.OFFLINE_INTERVAL
-        else:
-            new_interval = self.IDLE_INTERVAL
-
-        if new_interval != self._current_interval:
-            logger.debug(f"Adjusting polling interval: {self._current_interval}s → {new_interval}s")
-            self._current_interval = new_interval
+        # Single tuple comparison over the change-relevant fields
+        return new_status._change_key != self._last_status._change_key
@@ -3,6 +3,8 @@
 import gi
 import logging
 import os
+import shutil
+import subprocess
 import webbrowser
 from pathlib import Path
 from typing import Optional
@@ -14,24 +16,104 @@ from gi.repository import Gtk, GLib, AppIndicator3
 
 from .status_monitor import SyncStatus
 from .cli_interface import CLIInterface, JottaCLIError
-from .utils import format_quota, format_file_count
+from .utils import format_quota
 from . import autostart
 
 logger = logging.getLogger(__name__)
 
+# Opener for local files, located once at import time. webbrowser.open
+# re-scans \$BROWSER and the registered browser list on every call and is
+# not meant for file:// launches; xdg-open goes straight to the desktop's
+# handler.
+_XDG_OPEN = shutil.which("xdg-open")
+
+
+def _open_local_file(path) -> None:
+    """Open a local file with the desktop's default application."""
+    if _XDG_OPEN:
+        subprocess.Popen(
+            [_XDG_OPEN, str(path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    else:
+        # No xdg-open on this system; fall back to the stdlib launcher
+        webbrowser.open(f"file://{path}")
+
+
+# Configuration file locations, resolved once at import time (Path.home()
+# re-reads the environment on every call)
+_CONFIG_DIR = Path.home() / ".config" / "jotta-tray"
+_CONFIG_FILE = _CONFIG_DIR / "config.ini"
+
+# Template written to the config file on first use
+_DEFAULT_CONFIG_INI = """# Jotta Tray Configuration
+#
+# This file controls the behavior of the Jotta Cloud system tray widget.
+
+[monitoring]
+# Maximum time in seconds between full status fetches. Updates normally
+# arrive as soon as the daemon pushes them; the heartbeat only refreshes
+# slow-moving data such as quota.
+heartbeat_interval = 300
+
+[notifications]
+# Enable desktop notifications (true/false)
+enabled = true
+
+# Show notification when sync completes
+notify_on_sync_complete = true
+
+# Show notification when daemon goes offline
+notify_on_daemon_offline = true
+
+# Show notification when approaching quota limit
+notify_on_quota_warning = true
+
+# Quota warning threshold (percentage)
+quota_warning_threshold = 90
+"""
+
+# Pause/resume menu labels, precomputed so updates allocate nothing
+_PAUSE_LABEL = "Pause Backup"
+_RESUME_LABEL = "Resume Backup"
+
+# Memoized result of TrayWidget._find_icon_path. The install layout is
+# fixed for the process lifetime, so the sys.path scan only ever needs
+# to run once even if the widget is reinitialized.
+_CACHED_ICON_PATH: Optional[Path] = None
+
+# Icon file name per sync state. Module-level so lookups skip the
+# class-attribute resolution chain; the resolved absolute paths live in
+# the per-instance _icon_paths dict (they depend on the icon directory).
+_ICON_FILES = {
+    "idle": "jotta-idle",
+    "syncing": "jotta-syncing",
+    "paused": "jotta-paused",
+    "error": "jotta-error",
+    "offline": "jotta-offline",
+}
+
+# Small integer code per sync state. The render path branches on the
+# state several times per update; comparing ints skips the unicode
+# rich-compare dispatch of repeated string equality checks.
+_STATE_CODES = {"idle": 0, "syncing": 1, "paused": 2, "error": 3, "offline": 4}
+_CODE_SYNCING = 1
+_CODE_PAUSED = 2
+
+# Static tooltip line per non-syncing state
+_STATE_LINE = {
+    "idle": "All backed up",
+    "paused": "Backup paused",
+    "error": "Sync error",
+    "offline": "Daemon offline",
+}
+
 
 class TrayWidget:
     """System tray widget for displaying Jotta Cloud sync status."""
 
-    # Icon state mapping
-    ICON_STATES = {
-        "idle": "jotta-idle",
-        "syncing": "jotta-syncing",
-        "paused": "jotta-paused",
-        "error": "jotta-error",
-        "offline": "jotta-offline",
-    }
-
     def __init__(self, cli: CLIInterface, monitor: 'StatusMonitor', icon_path: Optional[Path] = None):
         """
         Initialize tray widget.
@@ -45,44 +127,75 @@ class TrayWidget:
         self.monitor = monitor
         self.icon_path = icon_path or self._find_icon_path()
 
+        # Absolute icon paths per state, resolved once: Path.resolve() does
+        # filesystem syscalls, so it has no place in per-update code
+        self._icon_paths = {
+            state: str((self.icon_path / f"{name}.svg").resolve())
+            for state, name in _ICON_FILES.items()
+        }
+
         # State
         self._current_state = "idle"
         self._current_status: Optional[SyncStatus] = None
+        self._current_icon_path: Optional[str] = None
+        self._config_dir_ready = False  # config dir known to exist
+
+        # Render coalescing: updates whose user-visible output would be
+        # identical are dropped, and bursts collapse into one idle callback
+        self._last_render: Optional[tuple] = None
+        self._pending_status: Optional[SyncStatus] = None
+        self._pending_idle = False
+        self._updating = False  # a render is currently applying GTK calls
 
         # UI components
         self.indicator: Optional[AppIndicator3.Indicator] = None
         self.status_icon: Optional[Gtk.StatusIcon] = None
         self.menu: Optional[Gtk.Menu] = None
 
+        # Dialogs, created lazily on first use and then reused (the About
+        # dialog in particular reparses the SVG logo on construction)
+        self._about_dialog: Optional[Gtk.AboutDialog] = None
+        self._error_dialog: Optional[Gtk.MessageDialog] = None
+        self._info_dialog: Optional[Gtk.MessageDialog] = None
+
         # Initialize the tray icon
         self._init_tray()
 
-        logger.info(f"TrayWidget initialized with icons from: {self.icon_path}")
+        logger.info("TrayWidget initialized with icons from: %s", self.icon_path)
 
     def _find_icon_path(self) -> Path:
         """
         Auto-detect icon directory path.
 
+        The answer is memoized at module level so the sys.path scan runs
+        at most once per process.
+
         Returns:
             Path to icon directory
         """
+        global _CACHED_ICON_PATH
+        if _CACHED_ICON_PATH is not None:
+            return _CACHED_ICON_PATH
+
         # Try relative to this file (new location: src/jotta_tray/icons/)
-        module_dir = Path(__file__).parent
-        icon_dir = module_dir / "icons"
+        icon_dir = Path(__file__).parent / "icons"
 
-        if icon_dir.exists():
+        if icon_dir.is_dir():
+            _CACHED_ICON_PATH = icon_dir
             return icon_dir
 
         # Try installed location
         import sys
         for path in sys.path:
             candidate = Path(path) / "jotta_tray" / "icons"
-            if candidate.exists():
+            if candidate.is_dir():
+                _CACHED_ICON_PATH = candidate
                 return candidate
 
         # Fallback to current directory
         logger.warning("Icon directory not found, using current directory")
-        return Path.cwd()
+        _CACHED_ICON_PATH = Path.cwd()
+        return _CACHED_ICON_PATH
 
     def _init_tray(self) -> None:
         """Initialize system tray icon using AppIndicator3."""
@@ -92,9 +205,10 @@ class TrayWidget:
         """Initialize AppIndicator3 system tray icon."""
         logger.info("Using AppIndicator3 for system tray")
 
-        # Get absolute path to initial icon (required for Waybar compatibility)
-        initial_icon = str(self._get_icon_path("idle").resolve())
-        logger.info(f"Using icon path: {initial_icon}")
+        # Absolute icon path is required for Waybar compatibility
+        initial_icon = self._icon_paths["idle"]
+        self._current_icon_path = initial_icon
+        logger.info("Using icon path: %s", initial_icon)
 
         # Create indicator with absolute icon path
         self.indicator = AppIndicator3.Indicator.new(
@@ -105,21 +219,29 @@ class TrayWidget:
 
         self.indicator.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
 
-        # Build menu
-        self.menu = self._build_menu()
+        # Build only the essential menu items now so the icon appears as
+        # early as possible; the remaining entries are filled in once the
+        # main loop goes idle (nobody can pop the menu up before then)
+        self.menu = self._build_menu_minimal()
         self.indicator.set_menu(self.menu)
+        GLib.idle_add(self._build_menu_full)
 
-    def _build_menu(self) -> Gtk.Menu:
+    def _build_menu_minimal(self) -> Gtk.Menu:
         """
-        Build context menu for tray icon.
+        Build the essential context menu items for tray icon startup.
+
+        Only the items that must exist immediately (status display,
+        pause/resume, quit) are created here; _build_menu_full adds the
+        rest once the main loop is idle.
 
         Returns:
-            Gtk.Menu with all menu items
+            Gtk.Menu with the essential menu items
         """
         menu = Gtk.Menu()
 
         # Storage info (non-clickable)
-        self.storage_item = Gtk.MenuItem(label="Loading...")
+        self._storage_label = "Loading..."
+        self.storage_item = Gtk.MenuItem(label=self._storage_label)
         self.storage_item.set_sensitive(False)
         menu.append(self.storage_item)
 
@@ -127,63 +249,160 @@ class TrayWidget:
         menu.append(Gtk.SeparatorMenuItem())
 
         # Pause/Resume (dynamic label)
-        self.pause_resume_item = Gtk.MenuItem(label="Pause Backup")
+        self._pause_label = _PAUSE_LABEL
+        self.pause_resume_item = Gtk.MenuItem(label=self._pause_label)
         self.pause_resume_item.connect("activate", self._on_pause_resume)
         menu.append(self.pause_resume_item)
 
+        # Quit
+        quit_item = Gtk.MenuItem(label="Quit")
+        quit_item.connect("activate", self._on_quit)
+        menu.append(quit_item)
+
+        menu.show_all()
+        return menu
+
+    def _build_menu_full(self) -> bool:
+        """
+        Fill in the interaction-only menu items (deferred idle callback).
+
+        Inserts the remaining entries in front of the Quit item, keeping
+        the same order the menu always had.
+
+        Returns:
+            False to remove the idle source
+        """
+        menu = self.menu
+        pos = 3  # insert in front of the Quit item
+
         # Open Web
         open_web_item = Gtk.MenuItem(label="Open Jottacloud Web")
         open_web_item.connect("activate", self._on_open_web)
-        menu.append(open_web_item)
+        menu.insert(open_web_item, pos)
+        pos += 1
 
         # View Logs
         view_logs_item = Gtk.MenuItem(label="View Logs")
         view_logs_item.connect("activate", self._on_view_logs)
-        menu.append(view_logs_item)
+        menu.insert(view_logs_item, pos)
+        pos += 1
 
         # Settings
         settings_item = Gtk.MenuItem(label="Settings")
         settings_item.connect("activate", self._on_settings)
-        menu.append(settings_item)
+        menu.insert(settings_item, pos)
+        pos += 1
 
         # Separator
-        menu.append(Gtk.SeparatorMenuItem())
+        menu.insert(Gtk.SeparatorMenuItem(), pos)
+        pos += 1
 
         # About
         about_item = Gtk.MenuItem(label="About")
         about_item.connect("activate", self._on_about)
-        menu.append(about_item)
-
-        # Quit
-        quit_item = Gtk.MenuItem(label="Quit")
-        quit_item.connect("activate", self._on_quit)
-        menu.append(quit_item)
+        menu.insert(about_item, pos)
 
         menu.show_all()
-        return menu
+        return False
+
+    @staticmethod
+    def _render_key(status: SyncStatus) -> tuple:
+        """Fingerprint of everything update_status renders for a snapshot."""
+        return (status.state, status.used_gb, status.total_gb,
+                status.uploading_count, status.downloading_count)
 
     def update_status(self, status: SyncStatus) -> None:
         """
         Update tray icon and tooltip based on new status.
 
+        Safe to call from any thread: no GTK call happens here. All
+        widget mutations are deferred to _flush_render, which runs as a
+        GLib idle callback on the main loop, so callers off the main
+        thread are marshalled automatically. Cheap to call on every
+        poll: snapshots that would render identically to what is already
+        shown are dropped, and bursts of updates coalesce into a single
+        deferred render so only the newest snapshot triggers GTK work.
+
         Args:
             status: New status snapshot
         """
         self._current_status = status
 
-        # Update icon if state changed
-        if status.state != self._current_state:
-            self.update_icon(status.state)
-            self._current_state = status.state
+        # Dedupe against what will actually be shown next: the stashed
+        # snapshot if a flush is already queued, else the last render.
+        # Comparing only against the last render would drop an update
+        # that differs from the pending one, sticking the UI on a stale
+        # snapshot.
+        key = self._render_key(status)
+        if self._pending_status is not None:
+            if key == self._render_key(self._pending_status):
+                return
+        elif key == self._last_render:
+            return
+
+        self._pending_status = status
+        if not self._pending_idle:
+            self._pending_idle = True
+            GLib.idle_add(self._flush_render)
+
+    def _flush_render(self) -> bool:
+        """
+        Apply the most recent pending status to the UI.
+
+        Runs as a one-shot GLib idle callback scheduled by update_status.
+
+        Guarded against reentrancy: dialog.run() spins a nested main
+        loop which dispatches idle sources, so a render scheduled while
+        another is mid-flight would otherwise interleave its GTK calls.
+        The nested invocation leaves the snapshot pending and the outer
+        one re-applies the newest state when it finishes.
+
+        Returns:
+            False to remove the idle source
+        """
+        self._pending_idle = False
 
-        # Update tooltip
-        self.update_tooltip(status)
+        if self._updating:
+            # Reentered from a nested main loop; the outer call picks up
+            # _pending_status in its finally block
+            return False
 
-        # Update storage info in menu
-        self._update_storage_menu_item(status)
+        status = self._pending_status
+        self._pending_status = None
 
-        # Update pause/resume button
-        self._update_pause_resume_item(status)
+        if status is None:
+            return False
+
+        self._updating = True
+        try:
+            # Map the state to its int code once and branch on that below
+            state_code = _STATE_CODES.get(status.state, 0)
+
+            # Update icon if state changed
+            if status.state != self._current_state:
+                self.update_icon(status.state)
+                self._current_state = status.state
+
+            # Format the quota once and share it between tooltip and menu
+            quota_str, _ = format_quota(status.used_gb << 30, status.total_gb << 30)
+
+            # Update tooltip
+            self.update_tooltip(status, quota_str, state_code)
+
+            # Update storage info in menu
+            self._update_storage_menu_item(status, quota_str)
+
+            # Update pause/resume button
+            self._update_pause_resume_item(status, state_code)
+
+            self._last_render = self._render_key(status)
+        finally:
+            self._updating = False
+            # Re-apply the newest snapshot stashed while we were rendering
+            if self._pending_status is not None and not self._pending_idle:
+                self._pending_idle = True
+                GLib.idle_add(self._flush_render)
+        return False
 
     def update_icon(self, state: str) -> None:
         """
@@ -192,50 +411,58 @@ class TrayWidget:
         Args:
             state: One of "idle", "syncing", "paused", "error", "offline"
         """
-        icon_file = self._get_icon_path(state)
+        # Precomputed absolute path (required for Waybar compatibility)
+        icon_path = self._icon_paths.get(state) or self._icon_paths["idle"]
+
+        if icon_path == self._current_icon_path:
+            # AppIndicator reparses the SVG on every set_icon_full, so
+            # don't re-issue it for the icon that is already showing
+            return
+        self._current_icon_path = icon_path
 
         if self.indicator:
-            # Use absolute path for Waybar compatibility
-            icon_path = str(icon_file.resolve())
             self.indicator.set_icon_full(icon_path, f"Jotta Cloud: {state}")
-            logger.debug(f"AppIndicator icon updated to: {icon_path}")
+            logger.debug("AppIndicator icon updated to: %s", icon_path)
         elif self.status_icon:
-            if icon_file.exists():
-                self.status_icon.set_from_file(str(icon_file))
-                logger.debug(f"StatusIcon updated to: {icon_file}")
+            if os.path.exists(icon_path):
+                self.status_icon.set_from_file(icon_path)
+                logger.debug("StatusIcon updated to: %s", icon_path)
             else:
-                logger.warning(f"Icon file not found: {icon_file}")
+                logger.warning("Icon file not found: %s", icon_path)
 
-    def update_tooltip(self, status: SyncStatus) -> None:
+    def update_tooltip(self, status: SyncStatus, quota_str: Optional[str] = None,
+                       state_code: Optional[int] = None) -> None:
         """
         Update tooltip text with current status information.
 
         Args:
             status: Status snapshot
+            quota_str: Pre-formatted quota string, if the caller already
+                computed one (avoids formatting it twice per render)
+            state_code: Pre-computed _STATE_CODES entry for status.state
         """
-        # Format storage quota
-        quota_str, quota_pct = format_quota(status.used_bytes, status.total_bytes)
+        if quota_str is None:
+            quota_str, _ = format_quota(status.used_gb << 30, status.total_gb << 30)
+        if state_code is None:
+            state_code = _STATE_CODES.get(status.state, 0)
 
         # Build tooltip text
-        lines = [
-            f"Jotta Cloud",
-            f"Storage: {quota_str}",
-        ]
+        lines = ["Jotta Cloud", "Storage: " + quota_str]
 
         # Add sync status
-        if status.state == "syncing":
-            if status.uploading_count > 0:
-                lines.append(f"Uploading {format_file_count(status.uploading_count)}")
-            if status.downloading_count > 0:
-                lines.append(f"Downloading {format_file_count(status.downloading_count)}")
-        elif status.state == "idle":
-            lines.append("All backed up")
-        elif status.state == "paused":
-            lines.append("Backup paused")
-        elif status.state == "error":
-            lines.append("Sync error")
-        elif status.state == "offline":
-            lines.append("Daemon offline")
+        if state_code == _CODE_SYNCING:
+            # Singular/plural handling inlined (this runs on every render;
+            # format_file_count stays available for other callers)
+            n = status.uploading_count
+            if n > 0:
+                lines.append("Uploading 1 file" if n == 1 else "Uploading %d files" % n)
+            n = status.downloading_count
+            if n > 0:
+                lines.append("Downloading 1 file" if n == 1 else "Downloading %d files" % n)
+        else:
+            state_line = _STATE_LINE.get(status.state)
+            if state_line:
+                lines.append(state_line)
 
         tooltip = "\n".join(lines)
 
@@ -244,23 +471,33 @@ class TrayWidget:
             self.status_icon.set_tooltip_text(tooltip)
         # Note: AppIndicator doesn't support tooltips directly
 
-        logger.debug(f"Tooltip updated: {tooltip}")
+        logger.debug("Tooltip updated: %s", tooltip)
 
-    def _update_storage_menu_item(self, status: SyncStatus) -> None:
-        """Update the storage info menu item."""
-        quota_str, _ = format_quota(status.used_bytes, status.total_bytes)
-        self.storage_item.set_label(f"Storage: {quota_str}")
+    def _update_storage_menu_item(self, status: SyncStatus, quota_str: Optional[str] = None) -> None:
+        """Update the storage info menu item (only when the text changed)."""
+        if quota_str is None:
+            quota_str, _ = format_quota(status.used_gb << 30, status.total_gb << 30)
 
-    def _update_pause_resume_item(self, status: SyncStatus) -> None:
+        new_label = "Storage: " + quota_str
+        if new_label == self._storage_label:
+            # set_label triggers notify + relayout even for identical text
+            return
+        self._storage_label = new_label
+        self.storage_item.set_label(new_label)
+
+    def _update_pause_resume_item(self, status: SyncStatus,
+                                  state_code: Optional[int] = None) -> None:
         """Update pause/resume menu item label based on state."""
-        if status.state == "paused":
-            self.pause_resume_item.set_label("Resume Backup")
-        else:
-            self.pause_resume_item.set_label("Pause Backup")
+        if state_code is None:
+            state_code = _STATE_CODES.get(status.state, 0)
+        new_label = _RESUME_LABEL if state_code == _CODE_PAUSED else _PAUSE_LABEL
+        if new_label != self._pause_label:
+            self._pause_label = new_label
+            self.pause_resume_item.set_label(new_label)
 
     def _get_icon_name(self, state: str) -> str:
         """Get icon name for state."""
-        return self.ICON_STATES.get(state, "jotta-idle")
+        return _ICON_FILES.get(state, "jotta-idle")
 
     def _get_icon_path(self, state: str) -> Path:
         """Get full path to icon file."""
@@ -269,37 +506,93 @@ class TrayWidget:
 
     # Event handlers
 
+    def _spawn_cli_async(self, args: list, on_exit) -> None:
+        """
+        Run a jotta-cli command without blocking the GTK main loop.
+
+        Uses GLib's native async spawn plus a child watch instead of
+        subprocess.run, so menu handlers return immediately even when the
+        daemon is slow to respond.
+
+        Args:
+            args: Command arguments (excluding 'jotta-cli')
+            on_exit: Called on the main loop as on_exit(success, stderr_text)
+        """
+        argv = [self.cli.cli_path] + list(args)
+
+        try:
+            pid, stdin_fd, stdout_fd, stderr_fd = GLib.spawn_async_with_pipes(
+                None,  # working directory
+                argv,
+                None,  # inherit environment
+                GLib.SpawnFlags.SEARCH_PATH | GLib.SpawnFlags.DO_NOT_REAP_CHILD,
+                None,  # no child setup
+            )
+        except GLib.Error as e:
+            logger.error("Failed to spawn %s: %s", argv[0], e)
+            on_exit(False, str(e))
+            return
+
+        # Only stderr is read back; close the other pipe ends right away
+        # or each spawn leaks two fds for the lifetime of the process
+        for unused_fd in (stdin_fd, stdout_fd):
+            try:
+                os.close(unused_fd)
+            except OSError:
+                pass
+
+        def _on_child_exit(pid, status):
+            try:
+                with os.fdopen(stderr_fd, "r", errors="replace") as f:
+                    stderr_text = f.read()
+            except OSError:
+                stderr_text = ""
+            GLib.spawn_close_pid(pid)
+
+            try:
+                GLib.spawn_check_exit_status(status)
+                success = True
+            except GLib.Error:
+                success = False
+
+            on_exit(success, stderr_text)
+
+        GLib.child_watch_add(GLib.PRIORITY_DEFAULT, pid, _on_child_exit)
+
     def _on_pause_resume(self, menuitem):
         """Handle pause/resume menu action."""
-        try:
-            if self._current_status and self._current_status.state == "paused":
-                self.cli.run_resume()
-                logger.info("Resume requested")
-            else:
-                self.cli.run_pause()
-                logger.info("Pause requested")
+        if self._current_status and self._current_status.state == "paused":
+            args, action = ["resume"], "Resume"
+        else:
+            args, action = ["pause", "8h"], "Pause"
 
-            # Trigger immediate status update for instant UI feedback
-            self.monitor.force_update()
+        def _on_exit(success, stderr_text):
+            if success:
+                logger.info("%s requested", action)
+                # Trigger immediate status update for instant UI feedback
+                self.monitor.force_update()
+                return
 
-        except JottaCLIError as e:
-            error_msg = str(e).lower()
+            error_msg = stderr_text.strip()
             # Ignore benign errors (already in desired state)
-            if "already paused" in error_msg or "already running" in error_msg:
-                logger.debug(f"Ignoring benign error: {e}")
+            lowered = error_msg.lower()
+            if "already paused" in lowered or "already running" in lowered:
+                logger.debug("Ignoring benign error: %s", error_msg)
                 return
             # Show dialog for genuine errors
-            logger.error(f"Pause/Resume failed: {e}")
-            self._show_error_dialog("Action Failed", str(e))
+            logger.error("Pause/Resume failed: %s", error_msg)
+            self._show_error_dialog("Action Failed", error_msg or f"{action} failed")
+
+        self._spawn_cli_async(args, _on_exit)
 
     def _on_open_web(self, menuitem):
         """Handle open web menu action."""
         url = "https://jottacloud.com/web"
         try:
             webbrowser.open(url)
-            logger.info(f"Opened web browser: {url}")
+            logger.info("Opened web browser: %s", url)
         except Exception as e:
-            logger.error(f"Failed to open browser: {e}")
+            logger.error("Failed to open browser: %s", e)
 
     def _on_view_logs(self, menuitem):
         """Handle view logs menu action."""
@@ -307,13 +600,13 @@ class TrayWidget:
             logfile = self.cli.get_logfile_path()
             if logfile and logfile.exists():
                 # Open with default text editor
-                webbrowser.open(f"file://{logfile}")
-                logger.info(f"Opened log file: {logfile}")
+                _open_local_file(logfile)
+                logger.info("Opened log file: %s", logfile)
             else:
                 self._show_error_dialog("Log File Not Found",
                                       "Unable to locate Jotta log file.")
         except JottaCLIError as e:
-            logger.error(f"Failed to get log file: {e}")
+            logger.error("Failed to get log file: %s", e)
             self._show_error_dialog("Error", str(e))
 
     def _on_settings(self, menuitem):
@@ -339,9 +632,11 @@ class TrayWidget:
         content_area.set_spacing(12)
         content_area.set_border_width(12)
 
-        # Create autostart checkbox
+        # Create autostart checkbox (state read once and reused after the
+        # dialog runs - nothing else changes it in between)
+        current_state = autostart.is_autostart_enabled()
         autostart_check = Gtk.CheckButton(label="Start automatically at login")
-        autostart_check.set_active(autostart.is_autostart_enabled())
+        autostart_check.set_active(current_state)
         content_area.pack_start(autostart_check, False, False, 0)
 
         # Add separator
@@ -362,7 +657,6 @@ class TrayWidget:
         if response == Gtk.ResponseType.OK:
             # Save autostart setting
             new_autostart_state = autostart_check.get_active()
-            current_state = autostart.is_autostart_enabled()
 
             if new_autostart_state != current_state:
                 if new_autostart_state:
@@ -371,10 +665,10 @@ class TrayWidget:
                     success, message = autostart.uninstall_autostart()
 
                 if success:
-                    logger.info(f"Autostart setting changed: {new_autostart_state}")
+                    logger.info("Autostart setting changed: %s", new_autostart_state)
                     self._show_info_dialog("Settings Saved", message)
                 else:
-                    logger.error(f"Failed to change autostart: {message}")
+                    logger.error("Failed to change autostart: %s", message)
                     self._show_error_dialog("Error", message)
 
         dialog.destroy()
@@ -382,75 +676,49 @@ class TrayWidget:
     def _on_open_config_file(self, button):
         """Open the configuration file in the default text editor."""
         try:
-            # Configuration file path
-            config_dir = Path.home() / ".config" / "jotta-tray"
-            config_file = config_dir / "config.ini"
-
-            # Create config directory if it doesn't exist
-            config_dir.mkdir(parents=True, exist_ok=True)
+            # Create config directory if it doesn't exist (checked once;
+            # the answer can't change underneath a running tray)
+            if not self._config_dir_ready:
+                if not _CONFIG_DIR.is_dir():
+                    _CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+                self._config_dir_ready = True
 
             # Create a template config file if it doesn't exist
-            if not config_file.exists():
-                config_file.write_text("""# Jotta Tray Configuration
-#
-# This file controls the behavior of the Jotta Cloud system tray widget.
-
-[monitoring]
-# Status polling interval in seconds when idle
-poll_interval_idle = 10
-
-# Status polling interval in seconds when syncing
-poll_interval_active = 2
-
-# Status polling interval in seconds when daemon is offline
-poll_interval_offline = 30
-
-[notifications]
-# Enable desktop notifications (true/false)
-enabled = true
-
-# Show notification when sync completes
-notify_on_sync_complete = true
-
-# Show notification when daemon goes offline
-notify_on_daemon_offline = true
-
-# Show notification when approaching quota limit
-notify_on_quota_warning = true
-
-# Quota warning threshold (percentage)
-quota_warning_threshold = 90
-""")
-                logger.info(f"Created template config file: {config_file}")
+            if not _CONFIG_FILE.exists():
+                _CONFIG_FILE.write_text(_DEFAULT_CONFIG_INI)
+                logger.info("Created template config file: %s", _CONFIG_FILE)
 
             # Open config file in default text editor
-            webbrowser.open(f"file://{config_file}")
-            logger.info(f"Opened config file: {config_file}")
+            _open_local_file(_CONFIG_FILE)
+            logger.info("Opened config file: %s", _CONFIG_FILE)
 
         except Exception as e:
-            logger.error(f"Failed to open config file: {e}")
+            logger.error("Failed to open config file: %s", e)
             self._show_error_dialog("Error", f"Failed to open configuration file: {e}")
 
     def _on_about(self, menuitem):
         """Handle about menu action."""
-        dialog = Gtk.AboutDialog()
-        dialog.set_program_name("Jottacloud Tray")
-        dialog.set_version("0.1.0")
-        dialog.set_comments("System tray widget for Jotta Cloud sync monitoring")
-        dialog.set_website("https://github.com/oal/jotta_tray")
-
-        # Load and set logo
-        try:
-            from gi.repository import GdkPixbuf
-            logo_path = self.icon_path / "jotta-idle.svg"
-            if logo_path.exists():
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(str(logo_path), 64, 64)
-                dialog.set_logo(pixbuf)
-        except Exception as e:
-            logger.warning(f"Failed to load logo for about dialog: {e}")
-
-        dialog.run()
-        dialog.destroy()
+        if self._about_dialog is None:
+            dialog = Gtk.AboutDialog()
+            dialog.set_program_name("Jottacloud Tray")
+            dialog.set_version("0.1.0")
+            dialog.set_comments("System tray widget for Jotta Cloud sync monitoring")
+            dialog.set_website("https://github.com/oal/jotta_tray")
+
+            # Load and set logo (once; the pixbuf lives with the dialog)
+            try:
+                from gi.repository import GdkPixbuf
+                logo_path = self.icon_path / "jotta-idle.svg"
+                if logo_path.exists():
+                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(str(logo_path), 64, 64)
+                    dialog.set_logo(pixbuf)
+            except Exception as e:
+                logger.warning("Failed to load logo for about dialog: %s", e)
+
+            self._about_dialog = dialog
+
+        self._about_dialog.run()
+        self._about_dialog.hide()
 
     def _on_quit(self, menuitem):
         """Handle quit menu action."""
@@ -459,29 +727,35 @@ quota_warning_threshold = 90
 
     def _show_error_dialog(self, title: str, message: str) -> None:
         """Show error message dialog."""
-        dialog = Gtk.MessageDialog(
-            parent=None,
-            flags=0,
-            message_type=Gtk.MessageType.ERROR,
-            buttons=Gtk.ButtonsType.OK,
-            text=title
-        )
-        dialog.format_secondary_text(message)
-        dialog.run()
-        dialog.destroy()
+        if self._error_dialog is None:
+            self._error_dialog = Gtk.MessageDialog(
+                parent=None,
+                flags=0,
+                message_type=Gtk.MessageType.ERROR,
+                buttons=Gtk.ButtonsType.OK,
+                text=title
+            )
+        self._run_message_dialog(self._error_dialog, title, message)
 
     def _show_info_dialog(self, title: str, message: str) -> None:
         """Show info message dialog."""
-        dialog = Gtk.MessageDialog(
-            parent=None,
-            flags=0,
-            message_type=Gtk.MessageType.INFO,
-            buttons=Gtk.ButtonsType.OK,
-            text=title
-        )
+        if self._info_dialog is None:
+            self._info_dialog = Gtk.MessageDialog(
+                parent=None,
+                flags=0,
+                message_type=Gtk.MessageType.INFO,
+                buttons=Gtk.ButtonsType.OK,
+                text=title
+            )
+        self._run_message_dialog(self._info_dialog, title, message)
+
+    @staticmethod
+    def _run_message_dialog(dialog: Gtk.MessageDialog, title: str, message: str) -> None:
+        """Update a reusable message dialog's text and run it modally."""
+        dialog.set_property("text", title)
         dialog.format_secondary_text(message)
         dialog.run()
-        dialog.destroy()
+        dialog.hide()
 
     def run(self) -> None:
         """Start GTK main loop."""
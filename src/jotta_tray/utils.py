@@ -1,13 +1,24 @@
 """Utility functions for formatting and data conversion."""
 
+from functools import lru_cache
 from typing import Tuple
 from datetime import datetime
 
+# Unit tables for format_bytes: the unit index is derived from
+# bit_length() (units step at exact powers of 2**10), replacing the
+# divide-and-compare loop with one shift-free lookup and one division
+_UNIT_NAMES = ("B", "KB", "MB", "GB", "TB", "PB")
+_UNIT_DIVISORS = tuple(1024.0 ** i for i in range(6))
 
+
+@lru_cache(maxsize=256)
 def format_bytes(bytes_value: int, decimal_places: int = 1) -> str:
     """
     Format bytes into human-readable string (KB, MB, GB, TB).
 
+    Results are memoized: status polls format the same byte values over
+    and over, so repeat calls return the cached string.
+
     Args:
         bytes_value: Number of bytes
         decimal_places: Number of decimal places to display (default: 1)
@@ -26,25 +37,24 @@ def format_bytes(bytes_value: int, decimal_places: int = 1) -> str:
     if bytes_value < 0:
         return "0 B"
 
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    unit_index = 0
-
-    value = float(bytes_value)
-
-    while value >= 1024.0 and unit_index < len(units) - 1:
-        value /= 1024.0
-        unit_index += 1
+    # Each unit covers exactly 10 bits, so bit_length picks the index
+    unit_index = min((bytes_value.bit_length() - 1) // 10, 5) if bytes_value else 0
 
     if unit_index == 0:  # Bytes - no decimal places
-        return f"{int(value)} {units[unit_index]}"
-    else:
-        return f"{value:.{decimal_places}f} {units[unit_index]}"
+        return f"{bytes_value} B"
+
+    value = bytes_value / _UNIT_DIVISORS[unit_index]
+    return f"{value:.{decimal_places}f} {_UNIT_NAMES[unit_index]}"
 
 
+@lru_cache(maxsize=256)
 def format_quota(used: int, total: int) -> Tuple[str, float]:
     """
     Format storage quota as readable string and percentage.
 
+    Memoized like format_bytes: total is essentially constant and used
+    changes slowly, so steady-state calls hit the cache.
+
     Args:
         used: Bytes used
         total: Total capacity in bytes
@@ -142,14 +152,9 @@ def parse_sync_state(state_data: dict) -> str:
     Returns:
         One of: "idle", "syncing", "paused", "error", "offline"
     """
-    # Check if uploading or downloading
-    uploading = state_data.get("Uploading", {})
-    downloading = state_data.get("Downloading", {})
-
-    has_uploads = len(uploading) > 0 if isinstance(uploading, dict) else False
-    has_downloads = len(downloading) > 0 if isinstance(downloading, dict) else False
-
-    if has_uploads or has_downloads:
+    # Missing keys, null and empty containers are all falsy, so a plain
+    # truthiness check covers every shape the daemon emits
+    if state_data.get("Uploading") or state_data.get("Downloading"):
         return "syncing"
 
     # Default to idle if no active transfers